@@ -4,9 +4,14 @@ Web interface for the company scraper tool.
 """
 
 import streamlit as st
-import json
+import ijson
+import orjson
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
+from company_scrapper.fetcher import create_driver_pool
 from company_scrapper.runner import run
 
 # Page configuration
@@ -19,6 +24,34 @@ st.set_page_config(
 
 st.subheader("⚠️ After Scraping Refresh it once")
 
+@st.cache_resource
+def get_driver_pool(_size=None):
+    """Start the Chrome driver pool once and keep it warm across scrapes."""
+    # The size hint is not part of the cache key: every scrape shares one full pool
+    return create_driver_pool()
+
+@st.cache_resource
+def get_executor():
+    """Background threads that run scrapes so the UI keeps rendering."""
+    return ThreadPoolExecutor(max_workers=2)
+
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def cached_run(url, _progress_callback=None):
+    """Scrape a URL, reusing the result of the same URL for an hour."""
+    # Underscored arguments are left out of the cache key. The driver pool is
+    # only requested, on this worker thread, if a page actually needs Chrome
+    result = run(url, get_driver_pool=get_driver_pool, progress_callback=_progress_callback)
+    if "identity" not in result:
+        # st.cache_data does not store exceptions, so a failed fetch is retried next time
+        raise RuntimeError("; ".join(result["metadata"]["errors"]) or "Failed to fetch the website")
+    return result
+
+@lru_cache(maxsize=64)
+def read_company_name(path, mtime):
+    """Stream only identity.company_name from a saved scrape, cached per file version."""
+    with open(path, "rb") as f:
+        return next(ijson.items(f, "identity.company_name"), Path(path).stem)
+
 # Custom CSS
 st.markdown("""
     <style>
@@ -72,16 +105,14 @@ with st.sidebar:
             for idx, json_file in enumerate(json_files[:5]):
                 # Extract company name from JSON file
                 try:
-                    with open(json_file) as f:
-                        file_data = json.load(f)
-                        company_name = file_data.get("identity", {}).get("company_name", json_file.stem)
+                    company_name = read_company_name(str(json_file), json_file.stat().st_mtime)
                 except:
                     company_name = json_file.stem
                 
                 # Use unique key for each button
                 if st.button(f"📄 {company_name}", use_container_width=True, key=f"recent_scrape_{idx}"):
-                    with open(json_file) as f:
-                        st.session_state.last_result = json.load(f)
+                    with open(json_file, "rb") as f:
+                        st.session_state.last_result = orjson.loads(f.read())
         else:
             st.info("No previous scrapes found")
     else:
@@ -89,25 +120,47 @@ with st.sidebar:
 
 # Main content
 if scrape_button and website_url:
-    with st.spinner("🔍 Scraping website... This may take a minute..."):
-        try:
-            result = run(website_url)
-            st.session_state.last_result = result
-            
-            # Save to examples folder
-            examples_dir = Path(__file__).parent / "examples"
-            examples_dir.mkdir(exist_ok=True)
-            
-            company_name = result['identity']['company_name'].lower().replace(" ", "_").replace("/", "_")
-            filename = f"{company_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            filepath = examples_dir / filename
-            
-            with open(filepath, 'w') as f:
-                json.dump(result, f, indent=2)
-            
-            st.success(f"✅ Saved to: examples/{filename}")
-        except Exception as e:
-            st.error(f"❌ Error: {str(e)}")
+    # Scrape on a background thread; the worker only updates this plain dict
+    progress = {"done": 0, "total": 0}
+
+    def update_progress(done, total):
+        progress["done"] = max(progress["done"], done)
+        progress["total"] = total
+
+    st.session_state.scrape_progress = progress
+    st.session_state.scrape_future = get_executor().submit(
+        cached_run, website_url, update_progress
+    )
+
+scrape_future = st.session_state.get("scrape_future")
+if scrape_future is not None and not scrape_future.done():
+    progress = st.session_state.scrape_progress
+    if progress["total"]:
+        st.progress(
+            progress["done"] / progress["total"],
+            text=f"🔍 Scraped {progress['done']} of {progress['total']} pages..."
+        )
+    else:
+        st.info("🔍 Scraping website... This may take a minute...")
+elif scrape_future is not None:
+    del st.session_state.scrape_future
+    try:
+        result = scrape_future.result()
+        st.session_state.last_result = result
+        
+        # Save to examples folder
+        examples_dir = Path(__file__).parent / "examples"
+        examples_dir.mkdir(exist_ok=True)
+        
+        company_name = result['identity']['company_name'].lower().replace(" ", "_").replace("/", "_")
+        filename = f"{company_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        filepath = examples_dir / filename
+        
+        filepath.write_bytes(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+        
+        st.success(f"✅ Saved to: examples/{filename}")
+    except Exception as e:
+        st.error(f"❌ Error: {str(e)}")
 
 # Display results if available
 if "last_result" in st.session_state:
@@ -243,13 +296,18 @@ if "last_result" in st.session_state:
     
     st.divider()
     # Download button
-    json_str = json.dumps(result, indent=2)
+    json_bytes = orjson.dumps(result, option=orjson.OPT_INDENT_2)
     st.download_button(
         label="📥 Download JSON",
-        data=json_str,
+        data=json_bytes,
         file_name=f"{result['identity']['company_name'].replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
         mime="application/json"
     )
 
 else:
     st.info("👈 Enter a website URL in the sidebar and click 'Start Scraping' to begin!")
+
+# Poll the running scrape: rerun shortly so progress and the result show up
+if "scrape_future" in st.session_state:
+    time.sleep(1)
+    st.rerun()
@@ -5,7 +5,8 @@ Handles identity, contacts, pricing, services, and business details.
 """
 
 from urllib.parse import urlparse
-from .utils import extract_emails, extract_phones, is_social_link
+import ahocorasick
+from .utils import clean_text, extract_emails, extract_phones
 import re
 
 # Keywords used to identify priority pages to crawl
@@ -22,19 +23,93 @@ PRIORITY_KEYWORDS = [
     "team", "our team", "leadership"
 ]
 
-def extract_identity(soup, url):
+# Common service/product keywords
+SERVICE_KEYWORDS = [
+    "service", "product", "solution", "tool", "platform",
+    "feature", "offering", "plan", "package", "subscription",
+    "software", "application", "api", "integration", "plugin"
+]
+
+# Pricing tier names
+TIER_KEYWORDS = ["starter", "basic", "pro", "premium", "enterprise", "business", "professional"]
+
+# Common industry/customer keywords
+CUSTOMER_KEYWORDS = [
+    "enterprise", "startup", "sme", "small business", "mid-market",
+    "enterprise", "healthcare", "finance", "retail", "education",
+    "manufacturing", "technology", "agency", "team", "business",
+    "professional", "developer", "freelancer", "consultant"
+]
+
+def _build_keyword_automaton(buckets):
+    """
+    Build an Aho-Corasick automaton that finds every keyword in one pass.
+    
+    Args:
+        buckets (dict): Bucket name -> list of lowercase keywords
+        
+    Returns:
+        ahocorasick.Automaton: Reports (keyword, frozenset of bucket names) per hit
+    """
+    keyword_buckets = {}
+    for bucket, keywords in buckets.items():
+        for keyword in keywords:
+            keyword_buckets.setdefault(keyword, set()).add(bucket)
+
+    automaton = ahocorasick.Automaton()
+    for keyword, names in keyword_buckets.items():
+        automaton.add_word(keyword, (keyword, frozenset(names)))
+    automaton.make_automaton()
+    return automaton
+
+# Built once at import and shared by the page text extractors
+_KEYWORD_AC = _build_keyword_automaton({
+    "service": SERVICE_KEYWORDS,
+    "customer": CUSTOMER_KEYWORDS,
+    "tier": TIER_KEYWORDS
+})
+
+def _find_keywords(automaton, text):
+    """Return bucket name -> set of keywords found in lowercase text, in one pass."""
+    hits = {}
+    for _, (keyword, buckets) in automaton.iter(text):
+        for bucket in buckets:
+            hits.setdefault(bucket, set()).add(keyword)
+    return hits
+
+# Priority keywords as URL path words; multi-word keywords also match
+# when written as one word, e.g. /aboutus
+PRIORITY_SET = frozenset(key.replace(" ", "") for key in PRIORITY_KEYWORDS)
+# Multi-word keywords matched as consecutive path words, e.g. /case-studies
+_PRIORITY_PHRASES = [f" {key} " for key in PRIORITY_KEYWORDS if " " in key]
+
+# Price formats. Three findall scans are faster here than one alternation,
+# which has to try every branch at each position
+# Prices with $ like $10 or $1,299.99/month
+_DOLLAR_PRICE_RE = re.compile(r'\$[\d,]+(?:\.\d{2})?(?:/(?:month|year))?')
+# Prices without $ followed by /month or /year
+_SLASH_PRICE_RE = re.compile(r'(?<![a-zA-Z])\d{2,5}(?:\.\d{2})?/(?:month|year)')
+# Standalone 2-5 digit numbers
+_BARE_PRICE_RE = re.compile(r'(?<!\$)\b\d{2,5}(?:\.\d{2})?\b(?![\d/])')
+
+# Free/trial mentions as whole words, searched in the lowercase text
+_FREE_RE = re.compile(r"\bfree\b")
+_TRIAL_RE = re.compile(r"\btrials?\b")
+
+def extract_identity(tree, url):
     """
     Extract company identity information (name, website, tagline).
     
     Args:
-        soup (BeautifulSoup): Parsed HTML object
+        tree (HTMLParser): Parsed HTML tree
         url (str): Current page URL
         
     Returns:
         dict: Company name, website URL, and tagline
     """
-    title = soup.title.string if soup.title else ""
-    h1 = soup.find("h1")
+    title_node = tree.css_first("title")
+    title = title_node.text() if title_node else ""
+    h1 = tree.css_first("h1")
     
     # Extract domain name from URL as fallback
     domain = urlparse(url).netloc.replace("www.", "").split(".")[0]
@@ -56,20 +131,40 @@ def extract_identity(soup, url):
     return {
         "company_name": company_name,
         "website": url,
-        "tagline": (h1.text.strip() if h1 else "")
+        "tagline": (clean_text(h1.text(separator=" ")) if h1 else "")
     }
 
-def extract_links(soup):
-    return [a["href"] for a in soup.find_all("a", href=True)]
+def extract_links(tree):
+    return (a.attributes.get("href") or "" for a in tree.css("a[href]"))
+
+def _path_words(link):
+    path = urlparse(link).path.lower()
+    for separator in "-_.":
+        path = path.replace(separator, "/")
+    return [word for word in path.split("/") if word]
+
+def _is_priority_page(link):
+    words = _path_words(link)
+    if PRIORITY_SET.intersection(words):
+        return True
+    joined = f" {' '.join(words)} "
+    return any(phrase in joined for phrase in _PRIORITY_PHRASES)
+
+# Pages whose details are most often missed, e.g. footer-linked contact pages
+TOP_PRIORITY_SET = frozenset(["pricing", "plans", "contact", "contactus"])
+
+# Pages that are mostly long-form posts rather than company details
+LOW_PRIORITY_SET = frozenset(["blog", "news", "updates", "resources"])
+
+def is_top_priority_page(link):
+    return not TOP_PRIORITY_SET.isdisjoint(_path_words(link))
+
+def is_low_priority_page(link):
+    return not LOW_PRIORITY_SET.isdisjoint(_path_words(link))
 
 def filter_priority_pages(links):
-    selected = []
-    for link in links:
-        for key in PRIORITY_KEYWORDS:
-            if key in link.lower():
-                selected.append(link)
-                break
-    return list(set(selected))
+    # dict.fromkeys deduplicates while keeping page order, so runs are repeatable
+    return list(dict.fromkeys(link for link in links if _is_priority_page(link)))
 
 def extract_contacts(text):
     return {
@@ -87,44 +182,39 @@ def extract_company_description(text):
     description = '. '.join(sentences).strip()
     
     # Clean up and limit to 500 characters
-    description = re.sub(r'\s+', ' ', description)
+    description = clean_text(description)
     if len(description) > 500:
         description = description[:500] + "..."
     
     return description
 
-def extract_services_and_products(text):
-    """Extract services, products, and offerings from text"""
+def extract_services_and_products(text, text_lower):
+    """Extract services, products, and offerings from text and its lowercase copy"""
     if not text:
         return []
     
     services = []
     
-    # Common service/product keywords
-    keywords = [
-        "service", "product", "solution", "tool", "platform",
-        "feature", "offering", "plan", "package", "subscription",
-        "software", "application", "api", "integration", "plugin"
-    ]
-    
     # Split text into words and find lines containing service/product keywords
     lines = text.split('\n')
-    for line in lines[:50]:  # Check first 50 lines
-        line_lower = line.lower().strip()
+    lines_lower = text_lower.split('\n')
+    for line, line_lower in zip(lines[:50], lines_lower[:50]):  # Check first 50 lines
+        line_lower = line_lower.strip()
         if not line_lower or len(line_lower) < 10:
             continue
         
         # Check if line mentions services/products
-        for keyword in keywords:
-            if keyword in line_lower and len(line) > 15 and len(line) < 200:
-                services.append(line.strip())
-                break
+        if len(line) > 15 and len(line) < 200 and "service" in _find_keywords(_KEYWORD_AC, line_lower):
+            services.append(line.strip())
     
     # Remove duplicates and return unique services
     return list(set(services))[:10]  # Return max 10 services
 
-def extract_pricing(text):
-    """Extract detailed pricing information"""
+def extract_pricing(text, text_lower, keyword_hits=None):
+    """
+    Extract detailed pricing information from text and its lowercase copy.
+    keyword_hits is the result of _find_keywords for the text, if already computed.
+    """
     if not text:
         return {}
     
@@ -135,105 +225,45 @@ def extract_pricing(text):
         "free_option": False
     }
     
-    text_lower = text.lower()
-    
-    # Check for free option
-    if "free" in text_lower:
-        pricing_info["free_option"] = True
+    # Extract pricing tiers
+    if keyword_hits is None:
+        keyword_hits = _find_keywords(_KEYWORD_AC, text_lower)
+    tiers = keyword_hits.get("tier", ())
+    pricing_info["tiers"] = [tier.capitalize() for tier in tiers]
     
-    # Check for trial
-    if "trial" in text_lower or "free trial" in text_lower:
-        pricing_info["trial_available"] = True
+    # Check for free option and trial
+    pricing_info["free_option"] = _FREE_RE.search(text_lower) is not None
+    pricing_info["trial_available"] = _TRIAL_RE.search(text_lower) is not None
     
-    # Extract pricing tiers
-    tier_keywords = ["starter", "basic", "pro", "premium", "enterprise", "business", "professional"]
-    for tier in tier_keywords:
-        if tier in text_lower:
-            pricing_info["tiers"].append(tier.capitalize())
-    
-    # Extract prices - match both with $ and without
-    # First try to get prices with $
-    price_pattern = r'\$[\d,]+(?:\.\d{2})?(?:/(?:month|year))?'
-    prices_with_dollar = re.findall(price_pattern, text)
-    
-    # Also get prices without $ that are followed by /month or /year
-    price_pattern_no_dollar = r'(?<![a-zA-Z])\d{2,5}(?:\.\d{2})?/(?:month|year)'
-    prices_no_dollar = re.findall(price_pattern_no_dollar, text)
-    
-    # Also get standalone prices (just dollars)
-    price_pattern_standalone = r'(?<!\$)\b\d{2,5}(?:\.\d{2})?\b(?![\d/])'
-    prices_standalone = re.findall(price_pattern_standalone, text)
-    
-    # Combine and normalize all prices
-    all_prices = set()
-    
-    # Add prices that already have $
-    for price in prices_with_dollar:
-        all_prices.add(price)
-    
-    # Add prices without $ and normalize them
-    for price in prices_no_dollar:
-        if not price.startswith('$'):
-            price = '$' + price
-        all_prices.add(price)
-    
-    # Add standalone prices with $
-    for price in prices_standalone:
-        if len(price) > 0 and price.isdigit() or ('.' in price):
-            price = '$' + price
-            all_prices.add(price)
+    # Extract prices, normalized to start with $
+    all_prices = set(_DOLLAR_PRICE_RE.findall(text))
+    all_prices.update('$' + price for price in _SLASH_PRICE_RE.findall(text))
+    all_prices.update('$' + price for price in _BARE_PRICE_RE.findall(text))
     
     # Convert set to sorted list and limit to 5
-    pricing_info["prices"] = sorted(list(all_prices))[:5]
-    
-    # Remove duplicates from tiers
-    pricing_info["tiers"] = list(set(pricing_info["tiers"]))
+    pricing_info["prices"] = sorted(all_prices)[:5]
     
     return pricing_info
 
-def extract_target_customers(text):
-    """Extract target customers/industries"""
+def extract_target_customers(text, text_lower, keyword_hits=None):
+    """
+    Extract target customers/industries from text and its lowercase copy.
+    keyword_hits is the result of _find_keywords for the text, if already computed.
+    """
     if not text:
         return []
     
-    customers = []
-    
-    # Common industry/customer keywords
-    keywords = [
-        "enterprise", "startup", "sme", "small business", "mid-market",
-        "enterprise", "healthcare", "finance", "retail", "education",
-        "manufacturing", "technology", "agency", "team", "business",
-        "professional", "developer", "freelancer", "consultant"
-    ]
-    
-    text_lower = text.lower()
-    for keyword in keywords:
-        if keyword in text_lower:
-            customers.append(keyword.capitalize())
-    
-    # Remove duplicates
-    return list(set(customers))
+    if keyword_hits is None:
+        keyword_hits = _find_keywords(_KEYWORD_AC, text_lower)
+    customers = keyword_hits.get("customer", ())
+    return [keyword.capitalize() for keyword in customers]
 
-def extract_business_info(text):
-    """Extract comprehensive business information"""
+def extract_business_info(text, text_lower):
+    """Extract comprehensive business information from text and its lowercase copy"""
+    # One scan of the full text serves both the tier and the customer keywords
+    keyword_hits = _find_keywords(_KEYWORD_AC, text_lower)
     return {
-        "services": extract_services_and_products(text),
-        "pricing": extract_pricing(text),
-        "target_customers": extract_target_customers(text)
+        "services": extract_services_and_products(text, text_lower),
+        "pricing": extract_pricing(text, text_lower, keyword_hits),
+        "target_customers": extract_target_customers(text, text_lower, keyword_hits)
     }
-
-def categorize_social_links(links):
-    socials = {}
-    for link in links:
-        l = link.lower()
-        if "linkedin" in l:
-            socials["linkedin"] = link
-        elif "twitter" in l or "x.com" in l:
-            socials["twitter"] = link
-        elif "facebook" in l:
-            socials["facebook"] = link
-        elif "instagram" in l:
-            socials["instagram"] = link
-        elif "youtube" in l:
-            socials["youtube"] = link
-    return socials
\ No newline at end of file
@@ -1,35 +1,143 @@
 """
 Web Fetcher Module
-Handles browser automation using Selenium WebDriver to fetch web pages.
+Fetches web pages over plain HTTP, and through Selenium WebDriver for pages
+that need a real browser to render.
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import queue
+
+import diskcache
+import httpx
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
 from webdriver_manager.chrome import ChromeDriverManager
-import time
+
+# Number of headless browsers used to fetch pages in parallel
+POOL_SIZE = 4
+
+# HTTP errors worth retrying in Chrome: sites often send these to non-browser
+# clients. Other errors, like 404, would come back the same from a browser
+BROWSER_RETRY_STATUSES = {403, 429}
+
+# ChromeDriver binary path, resolved once per process by get_driver
+_chromedriver_path = None
+
+# Browser-like User-Agent so sites serve the same HTML they give to Chrome
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# On-disk cache of (ETag, HTML) per URL, revalidated on every fetch
+CACHE_DIR = Path(__file__).parent.parent / ".cache" / "pages"
+CACHE_EXPIRE = 7 * 24 * 3600  # Seconds before an unused entry is dropped
+# Opened on first fetch by get_page_cache, so importing this module writes nothing
+_page_cache = None
 
 def get_driver():
     """
     Initialize and configure a Chrome WebDriver instance.
     
     Returns:
-        WebDriver: Configured Chrome WebDriver with headless disabled for visibility
+        WebDriver: Configured headless Chrome WebDriver
     """
+    global _chromedriver_path
+    if _chromedriver_path is None:
+        # Skip webdriver-manager's version check and download after the first driver
+        _chromedriver_path = ChromeDriverManager().install()
+
     options = Options()
-    # options.add_argument("--headless")  # Commented out to see browser window
+    options.add_argument("--headless=new")
     options.add_argument("--disable-gpu")
     options.add_argument("--no-sandbox")
     options.add_argument("--window-size=1920,1080")
 
     driver = webdriver.Chrome(
-        service=Service(ChromeDriverManager().install()),
+        service=Service(_chromedriver_path),
         options=options
     )
     # Set timeout to prevent hanging on slow sites
     driver.set_page_load_timeout(10)
     return driver
 
+def create_driver_pool(size=POOL_SIZE):
+    """
+    Start several Chrome WebDriver instances for parallel fetching.
+    
+    Args:
+        size (int): Number of drivers to start
+        
+    Returns:
+        queue.Queue: Pool of idle WebDriver instances
+    """
+    return fill_driver_pool(queue.Queue(), size)
+
+def fill_driver_pool(pool, size):
+    """
+    Start drivers until an idle pool holds at least size of them.
+    
+    Args:
+        pool (queue.Queue): Pool whose drivers are all idle
+        size (int): Number of drivers wanted
+        
+    Returns:
+        queue.Queue: The same pool
+    """
+    while pool.qsize() < size:
+        pool.put(get_driver())
+    return pool
+
+def close_driver_pool(pool):
+    """
+    Quit every driver in the pool.
+    
+    Args:
+        pool (queue.Queue): Pool created by create_driver_pool
+    """
+    while not pool.empty():
+        pool.get_nowait().quit()
+
+def replace_if_dead(driver):
+    """
+    Check that a driver's browser session still responds after a failed fetch.
+    
+    Args:
+        driver (WebDriver): Driver that just returned an error
+        
+    Returns:
+        WebDriver: The same driver if it is alive, otherwise a freshly started one
+    """
+    try:
+        driver.current_url
+        return driver
+    except WebDriverException:
+        pass
+
+    try:
+        new_driver = get_driver()
+    except Exception:
+        # Keep the dead driver in the pool so it is checked again next time
+        return driver
+    try:
+        driver.quit()
+    except Exception:
+        pass
+    return new_driver
+
+def _has_rendered_content(driver):
+    # Same signal as parser.has_rendered_content: a link plus a title or h1
+    return bool(
+        driver.find_elements(By.CSS_SELECTOR, "a[href]")
+        and driver.find_elements(By.CSS_SELECTOR, "title, h1")
+    )
+
 def fetch_page(driver, url, wait=2):
     """
     Fetch a web page using Selenium WebDriver.
@@ -37,15 +145,129 @@ def fetch_page(driver, url, wait=2):
     Args:
         driver (WebDriver): Selenium WebDriver instance
         url (str): URL to fetch
-        wait (int): Wait time in seconds after page loads
+        wait (int): Maximum time in seconds to wait for the page to render
         
     Returns:
         tuple: (page_source HTML string, error message if any)
     """
     try:
         driver.get(url)
-        time.sleep(wait)  # Wait for JavaScript to execute
+        # Pages sent to Chrome are JavaScript shells that already have a body,
+        # so wait for the rendered content itself instead of sleeping a fixed time
+        try:
+            WebDriverWait(driver, wait).until(_has_rendered_content)
+        except TimeoutException:
+            # Still not rendered; return what the page shows so far
+            pass
         return driver.page_source, None
     except Exception as e:
         # Return error message if page fails to load
-        return None, str(e)
\ No newline at end of file
+        return None, str(e)
+
+def fetch_pages(pool, urls, wait=2, on_fetched=None):
+    """
+    Fetch several pages in parallel, one pooled driver per worker.
+    
+    Args:
+        pool (queue.Queue): Pool created by create_driver_pool
+        urls (list): URLs to fetch
+        wait (int): Maximum time in seconds to wait for each page to render
+        on_fetched (callable): Called with no arguments from the worker
+                               thread as each page finishes
+        
+    Returns:
+        list: (page_source, error) tuples in the same order as urls
+    """
+    def fetch_with_pooled_driver(url):
+        driver = pool.get()
+        try:
+            html, error = fetch_page(driver, url, wait)
+            if error:
+                # A crashed Chrome would otherwise be handed out on every later fetch
+                driver = replace_if_dead(driver)
+            return html, error
+        finally:
+            pool.put(driver)
+            if on_fetched:
+                on_fetched()
+
+    with ThreadPoolExecutor(max_workers=POOL_SIZE) as executor:
+        return list(executor.map(fetch_with_pooled_driver, urls))
+
+def get_page_cache():
+    """
+    Open the on-disk page cache on first use.
+    
+    Returns:
+        diskcache.Cache: Shared page cache, or None if CACHE_DIR is not writable
+    """
+    global _page_cache
+    if _page_cache is None:
+        try:
+            _page_cache = diskcache.Cache(str(CACHE_DIR))
+        except Exception:
+            # Read-only install; pages are simply fetched without a cache
+            return None
+    return _page_cache
+
+async def fetch_with_cache(client, url, cache):
+    """
+    Fetch a page over HTTP, reusing the cached copy when the server answers 304.
+    
+    Args:
+        client (httpx.AsyncClient): Open HTTP client
+        url (str): URL to fetch
+        cache (diskcache.Cache): Page cache, or None to always download
+        
+    Returns:
+        tuple: (HTML string, error message if any, HTTP status code)
+    """
+    # Cache reads and writes are blocking SQLite calls, so they run in a
+    # worker thread to keep the other fetches in the event loop moving
+    cached = await asyncio.to_thread(cache.get, url) if cache is not None else None
+    headers = {"If-None-Match": cached[0]} if cached else {}
+
+    response = await client.get(url, headers=headers)
+    if response.status_code == 304 and cached:
+        # Unchanged since last run, the server sent no body
+        return cached[1], None, response.status_code
+    if response.is_error:
+        return None, f"HTTP {response.status_code}", response.status_code
+
+    etag = response.headers.get("etag")
+    if etag and cache is not None:
+        await asyncio.to_thread(cache.set, url, (etag, response.text), expire=CACHE_EXPIRE)
+    return response.text, None, response.status_code
+
+async def _fetch_all(urls, cache):
+    async with httpx.AsyncClient(
+        http2=True,
+        timeout=10,
+        follow_redirects=True,
+        headers={"User-Agent": USER_AGENT}
+    ) as client:
+        results = await asyncio.gather(
+            *[fetch_with_cache(client, url, cache) for url in urls],
+            return_exceptions=True
+        )
+
+    return [
+        (None, str(result), None) if isinstance(result, Exception) else result
+        for result in results
+    ]
+
+def fetch_static(urls):
+    """
+    Fetch several pages concurrently over plain HTTP, without a browser.
+    Pages with a cached ETag are revalidated instead of downloaded again.
+    
+    Args:
+        urls (list): URLs to fetch
+        
+    Returns:
+        list: (HTML string, error, HTTP status code or None if the request
+              failed) tuples in the same order as urls
+    """
+    if not urls:
+        return []
+    return asyncio.run(_fetch_all(urls, get_page_cache()))
@@ -1,38 +1,60 @@
 """
 HTML Parser Module
-Processes and extracts text from HTML content using BeautifulSoup.
+Processes and extracts text from HTML content using selectolax.
 """
 
-from bs4 import BeautifulSoup
+from selectolax.parser import HTMLParser
 from .utils import clean_text
 
+# Static HTML shorter than this is treated as a JavaScript shell
+MIN_STATIC_HTML_LENGTH = 2048
+
+# Visible text kept per page; business details are usually near the top
+MAX_PAGE_CHARS = 20_000
+
 def parse_html(html):
     """
-    Parse HTML content into a BeautifulSoup object.
+    Parse HTML content into a selectolax tree.
+    
+    Args:
+        html (str): Raw HTML string
+        
+    Returns:
+        HTMLParser: Parsed HTML tree for querying with css_first() and css()
+    """
+    return HTMLParser(html)
+
+def has_rendered_content(html, tree):
+    """
+    Check whether statically fetched HTML can be used without a browser.
     
     Args:
         html (str): Raw HTML string
+        tree (HTMLParser): Parsed HTML tree
         
     Returns:
-        BeautifulSoup: Parsed HTML object for querying
+        bool: False for tiny pages, pages without a title/h1, or pages without links
     """
-    return BeautifulSoup(html, "lxml")
+    if len(html) < MIN_STATIC_HTML_LENGTH:
+        return False
+    if tree.css_first("title") is None and tree.css_first("h1") is None:
+        return False
+    return tree.css_first("a[href]") is not None
 
-def get_visible_text(soup):
+def get_visible_text(tree, max_chars=MAX_PAGE_CHARS):
     """
     Extract visible text from HTML, removing script/style tags.
     
     Args:
-        soup (BeautifulSoup): Parsed HTML object
+        tree (HTMLParser): Parsed HTML tree
+        max_chars (int): Maximum number of characters to keep from the top of the page
         
     Returns:
         str: Cleaned visible text from the page
     """
     # Remove script and style tags as they contain non-visible content
-    for tag in soup(["script", "style", "noscript"]):
-        tag.decompose()
+    tree.strip_tags(["script", "style", "noscript"])
     
     # Get all remaining text and clean it
-    text = soup.get_text()
-    return clean_text(text)
-    return clean_text(soup.get_text(separator=" "))
\ No newline at end of file
+    root = tree.body if tree.body else tree
+    return clean_text(root.text(separator=" "))[:max_chars]
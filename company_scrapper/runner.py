@@ -5,39 +5,126 @@ It fetches pages, extracts data, and saves results to JSON files.
 """
 
 import argparse
-import json
 from datetime import datetime, timezone
+from itertools import count
 import os
 from pathlib import Path
+import queue
 
-from .fetcher import get_driver, fetch_page
-from .parser import parse_html, get_visible_text
+import orjson
+
+from .fetcher import (
+    BROWSER_RETRY_STATUSES,
+    POOL_SIZE,
+    close_driver_pool,
+    fetch_pages,
+    fetch_static,
+    fill_driver_pool
+)
+from .parser import parse_html, get_visible_text, has_rendered_content
 from .extractor import (
     extract_identity,
     extract_links,
     filter_priority_pages,
+    is_low_priority_page,
+    is_top_priority_page,
     extract_contacts,
-    categorize_social_links,
     extract_company_description,
     extract_business_info
 )
-from .utils import get_internal_links, is_social_link
+from .utils import SOCIAL_DOMAINS, clean_text, get_internal_links, get_social_platform
 
 # Maximum number of priority pages to crawl per website
 MAX_PAGES = 8
 
-def run(url):
+# Maximum characters of page text fed to the extractors per website;
+# pricing and contact pages get their share first, so a cap never cuts them
+MAX_TEXT_CHARS = 200_000
+
+# Visible text kept from blog/news style pages, which are mostly long posts
+LOW_PRIORITY_PAGE_CHARS = 5_000
+
+# Social platforms to look for; link scanning stops once all are found
+SOCIAL_PLATFORMS = set(SOCIAL_DOMAINS.values())
+
+def fetch_documents(urls, get_driver_pool, on_fetched=None):
+    """
+    Fetch and parse pages over plain HTTP, falling back to Chrome when needed.
+    
+    Args:
+        urls (list): URLs to fetch
+        get_driver_pool (callable): Called as get_driver_pool(size) to get a pool
+                                    with at least size drivers; only called when
+                                    a page has to be rendered in Chrome
+        on_fetched (callable): Called with no arguments as each page finishes
+        
+    Returns:
+        list: (parsed HTML tree or None, error) tuples in the same order as urls
+    """
+    documents = []
+    needs_browser = []
+    # Statically parsed trees of escalated pages, used if Chrome fails on them
+    static_trees = {}
+
+    for index, (html, error, status) in enumerate(fetch_static(urls)):
+        tree = parse_html(html) if html else None
+        if tree is not None and has_rendered_content(html, tree):
+            documents.append((tree, None))
+            if on_fetched:
+                on_fetched()
+        elif error and status is not None and status not in BROWSER_RETRY_STATUSES:
+            # Broken link; Chrome would only load the same error page
+            documents.append((None, error))
+            if on_fetched:
+                on_fetched()
+        else:
+            # Missing or JavaScript-only page, render it in Chrome instead
+            documents.append((None, error))
+            needs_browser.append(index)
+            static_trees[index] = tree
+
+    if needs_browser:
+        try:
+            driver_pool = get_driver_pool(min(POOL_SIZE, len(needs_browser)))
+        except Exception as e:
+            # Chrome could not start; fall back to whatever static HTML each page had
+            for index in needs_browser:
+                if static_trees[index] is not None:
+                    documents[index] = (static_trees[index], None)
+                else:
+                    documents[index] = (None, f"Browser unavailable: {e}")
+                if on_fetched:
+                    on_fetched()
+            return documents
+        rendered = fetch_pages(driver_pool, [urls[i] for i in needs_browser], on_fetched=on_fetched)
+        for index, (html, error) in zip(needs_browser, rendered):
+            if html:
+                documents[index] = (parse_html(html), None)
+            elif static_trees[index] is not None:
+                documents[index] = (static_trees[index], None)
+            else:
+                documents[index] = (None, error)
+
+    return documents
+
+def run(url, get_driver_pool=None, progress_callback=None):
     """
     Main function to scrape company information from a website.
     
     Args:
         url (str): The company website URL to scrape
+        get_driver_pool (callable): get_driver_pool(size) returns a warm driver pool
+                                    to reuse and leave open, called only if a page
+                                    needs Chrome; None starts a pool sized to the
+                                    pages that need it and closes it
+        progress_callback (callable): Called as progress_callback(pages_done, pages_total)
+                                      after each page is fetched, possibly from a
+                                      worker thread
         
     Returns:
         dict: Comprehensive company information including identity, contacts, 
               pricing, services, and pages visited
     """
-    driver = get_driver()
     result = {
         "metadata": {
             "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -46,61 +133,118 @@ def run(url):
         }
     }
 
-    html, error = fetch_page(driver, url)
-    if error or not html:
-        result["metadata"]["errors"].append(str(error))
-        driver.quit()
-        return result
+    owned_driver_pool = None
+
+    def get_owned_driver_pool(size):
+        nonlocal owned_driver_pool
+        if owned_driver_pool is None:
+            owned_driver_pool = queue.Queue()
+        # Drivers started for earlier pages are reused; only the shortfall is started
+        return fill_driver_pool(owned_driver_pool, size)
 
-    soup = parse_html(html)
-    homepage_text = get_visible_text(soup)
+    if get_driver_pool is None:
+        get_driver_pool = get_owned_driver_pool
 
-    result["identity"] = extract_identity(soup, url)
+    try:
+        fetched = fetch_documents([url], get_driver_pool)
+        tree, error = fetched[0]
+        if error or tree is None:
+            result["metadata"]["errors"].append(str(error))
+            return result
 
-    all_text = homepage_text
-    social_links = set()
+        homepage_text = get_visible_text(tree)
 
-    homepage_links = extract_links(soup)
-    internal_links = get_internal_links(url, homepage_links)
-    priority_pages = filter_priority_pages(internal_links)
+        result["identity"] = extract_identity(tree, url)
 
-    visited = []
-    page_contents = {}
+        social_links = {}
 
-    for page_url in priority_pages[:MAX_PAGES]:
-        page_html, err = fetch_page(driver, page_url)
-        if not page_html:
-            continue
+        # Links stream through the pipeline and are only materialized here
+        homepage_links = extract_links(tree)
+        internal_links = get_internal_links(url, homepage_links)
+        priority_pages = filter_priority_pages(internal_links)
 
-        page_soup = parse_html(page_html)
-        page_text = get_visible_text(page_soup)
-        all_text += " " + page_text
-        visited.append(page_url)
+        visited = []
+        page_contents = {}
+        page_texts = []
+
+        # Fetch priority pages concurrently, then parse them on this thread
+        page_urls = priority_pages[:MAX_PAGES]
+        pages_total = 1 + len(page_urls)
+        pages_done = count(2)
+
+        def report_page_fetched():
+            # count() hands out each number once, even across fetch worker threads
+            progress_callback(next(pages_done), pages_total)
+
+        if progress_callback:
+            progress_callback(1, pages_total)
+        fetched = fetch_documents(
+            page_urls,
+            get_driver_pool,
+            on_fetched=report_page_fetched if progress_callback else None
+        )
+
+        for page_url, (page_tree, err) in zip(page_urls, fetched):
+            if page_tree is None:
+                if err:
+                    result["metadata"]["errors"].append(f"{page_url}: {err}")
+                continue
+
+            if is_low_priority_page(page_url):
+                page_text = get_visible_text(page_tree, LOW_PRIORITY_PAGE_CHARS)
+            else:
+                page_text = get_visible_text(page_tree)
+            page_texts.append((page_url, page_text))
+            visited.append(page_url)
         
-        # Store page content and metadata
-        page_contents[page_url] = {
-            "text_preview": page_text[:500],  # First 500 chars
-            "title": page_soup.title.string if page_soup.title else "",
-            "headings": [h.text.strip() for h in page_soup.find_all(['h1', 'h2', 'h3'])[:5]]
-        }
+            # Store page content and metadata
+            title = page_tree.css_first("title")
+            page_contents[page_url] = {
+                "text_preview": page_text[:500],  # First 500 chars
+                "title": title.text() if title else "",
+                "headings": [clean_text(h.text(separator=" ")) for h in page_tree.css("h1, h2, h3")[:5]]
+            }
 
-        for a in page_soup.find_all("a", href=True):
-            if is_social_link(a["href"]):
-                social_links.add(a["href"])
+            for a in page_tree.css("a[href]"):
+                if len(social_links) == len(SOCIAL_PLATFORMS):
+                    break
+                href = a.attributes.get("href")
+                platform = get_social_platform(href) if href else None
+                if platform:
+                    social_links.setdefault(platform, href)
 
-    result["contacts"] = extract_contacts(all_text)
-    result["social_links"] = categorize_social_links(social_links)
-    result["description"] = extract_company_description(all_text)
-    result["business_info"] = extract_business_info(all_text)
+        # Collect page text in a list and join once to avoid repeated string copies.
+        # The homepage goes first, then pricing and contact pages, then the rest
+        # in link order; text stops being added once the extractor budget is used up
+        text_chunks = [homepage_text]
+        total_len = len(homepage_text)
+        page_texts.sort(key=lambda page: not is_top_priority_page(page[0]))
+        for _, page_text in page_texts:
+            if total_len >= MAX_TEXT_CHARS:
+                break
+            text_chunks.append(page_text[:MAX_TEXT_CHARS - total_len])
+            total_len += len(text_chunks[-1])
 
-    result["key_pages"] = {
-        "visited": visited,
-        "page_details": page_contents
-    }
+        all_text = " ".join(text_chunks)
+        # Lowercase once and share it across every extractor
+        all_text_lower = all_text.lower()
+
+        result["contacts"] = extract_contacts(all_text)
+        result["social_links"] = social_links
+        result["description"] = extract_company_description(all_text)
+        result["business_info"] = extract_business_info(all_text, all_text_lower)
+
+        result["key_pages"] = {
+            "visited": visited,
+            "page_details": page_contents
+        }
+
+        result["metadata"]["pages_crawled"] = 1 + len(visited)
+    finally:
+        # Always stop Chrome processes this run started, even on errors
+        if owned_driver_pool is not None:
+            close_driver_pool(owned_driver_pool)
 
-    result["metadata"]["pages_crawled"] = 1 + len(visited)
-    
-    driver.quit()
     print(f"\n{'='*60}")
     print(f"Company: {result['identity']['company_name']}")
     print(f"Website: {result['identity']['website']}")
@@ -114,7 +258,7 @@ def run(url):
         print(f"Services/Products: {', '.join(result['business_info']['services'][:5])}")
     if result['business_info']['target_customers']:
         print(f"Target Customers: {', '.join(result['business_info']['target_customers'])}")
-    
+
     pricing = result['business_info']['pricing']
     if pricing:
         print(f"\nPricing Details:")
@@ -122,7 +266,7 @@ def run(url):
         print(f"  Prices: {', '.join(pricing['prices']) if pricing['prices'] else 'N/A'}")
         print(f"  Free Option: {'Yes' if pricing['free_option'] else 'No'}")
         print(f"  Trial Available: {'Yes' if pricing['trial_available'] else 'No'}")
-    
+
     print(f"\n{'='*60}")
     print(f"\nEmails Found: {result['contacts']['emails']}")
     print(f"Phones Found: {result['contacts']['phones']}")
@@ -153,9 +297,9 @@ if __name__ == "__main__":
     filename = f"{company_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
     filepath = examples_dir / filename
     
-    # Save JSON output
-    with open(filepath, 'w') as f:
-        json.dump(output, f, indent=2)
+    # Save JSON output, serialized once for both the file and the terminal
+    json_bytes = orjson.dumps(output, option=orjson.OPT_INDENT_2)
+    filepath.write_bytes(json_bytes)
     
-    print(json.dumps(output, indent=2))
+    print(json_bytes.decode())
     print(f"\n✓ Saved to: {filepath}")
\ No newline at end of file
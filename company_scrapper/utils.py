@@ -6,15 +6,28 @@ Contains helper functions for text processing, URL handling, and data extraction
 import re
 from urllib.parse import urljoin, urlparse
 
-# List of social media domains to identify social links
-SOCIAL_DOMAINS = [
-    "linkedin.com",
-    "twitter.com",
-    "x.com",
-    "facebook.com",
-    "instagram.com",
-    "youtube.com"
-]
+# Social media domains mapped to the platform they are reported under
+SOCIAL_DOMAINS = {
+    "linkedin.com": "linkedin",
+    "twitter.com": "twitter",
+    "x.com": "twitter",
+    "facebook.com": "facebook",
+    "instagram.com": "instagram",
+    "youtube.com": "youtube"
+}
+
+# Patterns are compiled once at import instead of on every call
+_WS_RE = re.compile(r"\s+")
+_EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+# Matches formats like +1-555-123-4567, (555) 123-4567, etc.
+_PHONE_RE = re.compile(r"(?:\+\d{1,3}[-.\s]?)?\(?[0-9]{2,4}\)?[-.\s]?[0-9]{2,4}[-.\s]?[0-9]{4}")
+_NON_PHONE_CHARS_RE = re.compile(r"[^\d+]")
+_SHORT_NUMBER_RE = re.compile(r"^\d{1,4}$")
+# Any social domain as a whole host name or subdomain, e.g. www.linkedin.com
+_SOCIAL_RE = re.compile(
+    r"(?:^|//|\.)(" + "|".join(map(re.escape, SOCIAL_DOMAINS)) + r")\b",
+    re.IGNORECASE
+)
 
 def clean_text(text):
     """
@@ -26,10 +39,8 @@ def clean_text(text):
     Returns:
         str: Cleaned text with single spaces
     """
-    if not text:
-        return ""
     # Replace multiple spaces/newlines with single space
-    return re.sub(r"\s+", " ", text).strip()
+    return _WS_RE.sub(" ", text).strip() if text else ""
 
 def extract_emails(text):
     """
@@ -41,9 +52,7 @@ def extract_emails(text):
     Returns:
         list: Unique email addresses found
     """
-    return list(set(re.findall(
-        r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", text or ""
-    )))
+    return list(set(_EMAIL_RE.findall(text or "")))
 
 def extract_phones(text):
     """
@@ -58,21 +67,19 @@ def extract_phones(text):
     if not text:
         return []
     
-    # Better regex for phone numbers - matches formats like +1-555-123-4567, (555) 123-4567, etc.
-    phone_pattern = r"(?:\+\d{1,3}[-.\s]?)?\(?[0-9]{2,4}\)?[-.\s]?[0-9]{2,4}[-.\s]?[0-9]{4}"
-    matches = re.findall(phone_pattern, text)
+    matches = _PHONE_RE.findall(text)
     
     # Clean and filter duplicates
     phones = []
     seen = set()
     for match in matches:
         # Extract only digits and + for deduplication
-        cleaned = re.sub(r'[^\d+]', '', match)
+        cleaned = _NON_PHONE_CHARS_RE.sub("", match)
         
         # Filter out short numbers and duplicates
         if len(cleaned) >= 8 and cleaned not in seen:
             # Skip single/double/triple digit numbers (likely noise)
-            if not re.match(r'^\d{1,4}$', cleaned):
+            if not _SHORT_NUMBER_RE.match(cleaned):
                 phones.append(match.strip())
                 seen.add(cleaned)
     
@@ -84,67 +91,32 @@ def get_internal_links(base_url, links):
     
     Args:
         base_url (str): Base URL of the website
-        links (list): List of all links found
+        links (iterable): All links found
         
-    Returns:
-        list: Internal links only
+    Yields:
+        str: Absolute internal links, in page order
     """
-    internal = set()
     base_domain = urlparse(base_url).netloc
 
-    for link in links:
+    # Navigation repeats links, so deduplicate before any URL parsing
+    for link in dict.fromkeys(links):
+        # Absolute links that never mention the domain cannot be internal
+        if link.startswith(("http://", "https://")) and base_domain not in link:
+            continue
         full = urljoin(base_url, link)
         # Only include links from same domain
         if urlparse(full).netloc == base_domain:
-            internal.add(full)
-
-    return list(internal)
+            yield full
 
-def is_social_link(url):
+def get_social_platform(url):
     """
-    Check if a URL is a social media link.
+    Identify which social media platform a URL belongs to.
     
     Args:
         url (str): URL to check
         
     Returns:
-        bool: True if URL is from social media domain
+        str: Platform name such as "linkedin", or None for non-social URLs
     """
-    return any(domain in url.lower() for domain in SOCIAL_DOMAINS)
-    if not text:
-        return []
-    
-    # Better regex for phone numbers
-    # Matches patterns like: +1-555-123-4567, (555) 123-4567, +1 555 123 4567, etc.
-    phone_pattern = r"(?:\+\d{1,3}[-.\s]?)?\(?[0-9]{2,4}\)?[-.\s]?[0-9]{2,4}[-.\s]?[0-9]{4}"
-    matches = re.findall(phone_pattern, text)
-    
-    # Clean and filter
-    phones = []
-    seen = set()
-    for match in matches:
-        # Clean the phone number
-        cleaned = re.sub(r'[^\d+]', '', match)  # Keep only digits and +
-        
-        # Filter out numbers that are too short or are just dates/numbers
-        if len(cleaned) >= 8 and cleaned not in seen:
-            # Check it's not just random numbers or dates
-            if not re.match(r'^\d{1,4}$', cleaned):  # Skip single/double/triple digit numbers
-                phones.append(match.strip())
-                seen.add(cleaned)
-    
-    return phones
-
-def get_internal_links(base_url, links):
-    internal = set()
-    base_domain = urlparse(base_url).netloc
-
-    for link in links:
-        full = urljoin(base_url, link)
-        if urlparse(full).netloc == base_domain:
-            internal.add(full)
-
-    return list(internal)
-
-def is_social_link(url):
-    return any(domain in url.lower() for domain in SOCIAL_DOMAINS)
\ No newline at end of file
+    match = _SOCIAL_RE.search(url)
+    return SOCIAL_DOMAINS[match[1].lower()] if match else None